@@ -1,46 +1,218 @@
+import importlib.util
+import os
+import pickle
+import struct
+from contextlib import nullcontext
 from pathlib import Path
-from typing import Union
+from typing import TYPE_CHECKING, List, Optional, Union
 
-import joblib
 import pandas as pd
-import pyarrow as pa
+
+from .utils import check_columns, select_columns
+
+if TYPE_CHECKING:
+    import pyarrow as pa
+
+# pyarrow and joblib are imported where they are used, so that each backend only
+# pays the import cost of its own library.
+
+_ARROW_INVALID_MESSAGE = (
+    "It seems that your query is returning a column with a type not "
+    "yet supported by Arrow. Consider using 'joblib' instead: "
+    "Database(uri='...', store_backend='joblib')"
+)
 
 
 class BaseSerializer:
     fmt = ""
     extension = ""
 
+    @classmethod
+    def load_table(
+        cls, filepath: Union[str, Path], columns: Optional[List[str]] = None
+    ) -> "pa.Table":
+        """Load results as an Arrow table.
+
+        Serializers that do not store Arrow data convert the loaded dataframe.
+        """
+        import pyarrow as pa
+
+        results = cls.load(filepath, columns=columns)
+        return pa.Table.from_pandas(results, preserve_index=None)
+
 
 class ParquetSerializer(BaseSerializer):
     """A serializer of pd.DataFrame to parquet format.
 
     Parameters
     ----------
-    compression : {'snappy', 'gzip', 'brotli', None}, default 'snappy'
-        Name of the compression to use. See pd.DataFrame.to_parquet docs
+    compression : {'zstd', 'snappy', 'gzip', 'brotli', 'lz4', None}, default 'zstd'
+        Name of the compression to use, or a tuple (codec, level) to also set
+        the compression level. If None, zstd at level 3 is used, falling back
+        to snappy when pyarrow was built without zstd support.
+        See pd.DataFrame.to_parquet docs
+    row_group_size
+        Maximum number of rows per row group. If None, results are split in up
+        to four row groups of at least 65536 rows.
     """
 
     fmt = "parquet"
     extension = ".parquet"
 
-    def __init__(self, compression=None):
-        self.compression = compression or "snappy"
+    def __init__(self, compression=None, row_group_size: Optional[int] = None):
+        import pyarrow as pa
+
+        if isinstance(compression, tuple):
+            compression, compression_level = compression
+        else:
+            compression_level = None
+
+        if compression is None:
+            compression, compression_level = "zstd", 3
+
+        if compression == "zstd" and not pa.Codec.is_available("zstd"):
+            compression, compression_level = "snappy", None
+
+        self.compression = compression
+        self.compression_level = compression_level
+        self.row_group_size = row_group_size
 
     @classmethod
-    def load(cls, filepath: Union[str, Path]) -> pd.DataFrame:
-        """Load dataframe from parquet file."""
-        return pd.read_parquet(filepath)
+    def load_table(
+        cls, filepath: Union[str, Path], columns: Optional[List[str]] = None
+    ) -> "pa.Table":
+        """Load an Arrow table from a memory-mapped parquet file.
+
+        If columns is given, only the chunks of those columns are read from disk.
+        """
+        import pyarrow.parquet as pq
+
+        # Column chunks are decoded in parallel by Arrow's thread pool, which
+        # releases the GIL and defaults to one thread per core.
+        with pq.ParquetFile(filepath, memory_map=True) as parquet_file:
+            # Unknown columns would otherwise be silently ignored
+            if columns is not None:
+                check_columns(columns, parquet_file.schema_arrow.names)
+            return parquet_file.read(
+                columns=columns, use_threads=True, use_pandas_metadata=True
+            )
+
+    @classmethod
+    def load(
+        cls, filepath: Union[str, Path], columns: Optional[List[str]] = None
+    ) -> pd.DataFrame:
+        """Load dataframe from a memory-mapped parquet file."""
+        table = cls.load_table(filepath, columns=columns)
+        # Columns are consolidated into pandas blocks, which copies them out of
+        # Arrow's immutable buffers. Zero-copy options (split_blocks, self_destruct)
+        # would hand back read-only arrays.
+        return table.to_pandas(use_threads=True)
 
     def dump(self, results: pd.DataFrame, filepath: Union[str, Path]) -> None:
-        """Dump dataframe to parquet file."""
+        """Dump dataframe to parquet file.
+
+        By default, large results are split in up to four row groups of at least
+        65536 rows, so that they can be decoded in parallel on load, with 1MB data
+        pages. Statistics are not written since rows of cached results are never
+        filtered on load.
+        """
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
         try:
-            results.to_parquet(filepath, compression=self.compression)
+            # A default RangeIndex, as returned by pd.read_sql, is only kept in the
+            # pandas metadata and never written as a column. Other indexes are
+            # written since they carry information.
+            table = pa.Table.from_pandas(results, preserve_index=None)
+            pq.write_table(
+                table,
+                filepath,
+                row_group_size=self.row_group_size or max(len(results) // 4, 65_536),
+                data_page_size=1 << 20,
+                compression=self.compression,
+                compression_level=self.compression_level,
+                use_dictionary=True,
+                write_statistics=False,
+            )
         except pa.ArrowInvalid:
-            raise ValueError(
-                "It seems that your query is returning a column with a type not "
-                "yet supported by Arrow. Consider using 'joblib' instead: "
-                "Database(uri='...', store_backend='joblib')"
+            raise ValueError(_ARROW_INVALID_MESSAGE)
+
+
+class FeatherSerializer(BaseSerializer):
+    """A serializer of pd.DataFrame to feather (Arrow IPC) format.
+
+    Feather files are faster to write and read than parquet, at the cost of
+    bigger files. They are memory-mapped on load.
+
+    Parameters
+    ----------
+    compression : {'lz4', 'zstd', 'uncompressed', None}, default 'lz4'
+        Name of the compression to use, or a tuple (codec, level) to also set
+        the compression level. See pyarrow.feather.write_feather docs
+    """
+
+    fmt = "feather"
+    extension = ".feather"
+
+    def __init__(self, compression=None):
+        import pyarrow as pa
+
+        if isinstance(compression, tuple):
+            compression, compression_level = compression
+        else:
+            compression_level = None
+
+        compression = compression or "lz4"
+        if compression == "lz4" and not pa.Codec.is_available("lz4"):
+            compression = "uncompressed"
+
+        self.compression = compression
+        self.compression_level = compression_level
+
+    @classmethod
+    def load_table(
+        cls, filepath: Union[str, Path], columns: Optional[List[str]] = None
+    ) -> "pa.Table":
+        """Load an Arrow table, or only the given columns, from a feather file."""
+        import pyarrow as pa
+        import pyarrow.feather as feather
+
+        if columns is not None:
+            # Only the footer is read to get the schema
+            with pa.ipc.open_file(filepath) as reader:
+                check_columns(columns, reader.schema.names)
+            if hasattr(filepath, "seek"):
+                filepath.seek(0)
+
+        return feather.read_table(
+            filepath, columns=columns, memory_map=True, use_threads=True
+        )
+
+    @classmethod
+    def load(
+        cls, filepath: Union[str, Path], columns: Optional[List[str]] = None
+    ) -> pd.DataFrame:
+        """Load dataframe, or only the given columns, from a memory-mapped feather file."""
+        table = cls.load_table(filepath, columns=columns)
+        # Consolidating into pandas blocks copies columns out of the memory map,
+        # so that loaded frames are writable.
+        return table.to_pandas(use_threads=True)
+
+    def dump(self, results: pd.DataFrame, filepath: Union[str, Path]) -> None:
+        """Dump dataframe to feather file."""
+        import pyarrow as pa
+        import pyarrow.feather as feather
+
+        try:
+            table = pa.Table.from_pandas(results, preserve_index=None)
+            feather.write_feather(
+                table,
+                filepath,
+                compression=self.compression,
+                compression_level=self.compression_level,
             )
+        except pa.ArrowInvalid:
+            raise ValueError(_ARROW_INVALID_MESSAGE)
 
 
 class JoblibSerializer(BaseSerializer):
@@ -50,20 +222,120 @@ class JoblibSerializer(BaseSerializer):
     ----------
     compression
         Optional compression level for the data. Passed to parameter
-        'compress' of joblib.dump. See joblib docs
+        'compress' of joblib.dump. See joblib docs. Use 'lz4' or ('lz4', level)
+        for fast compression; falls back to zlib when lz4 is not installed.
     """
 
     fmt = "joblib"
     extension = ".joblib"
 
     def __init__(self, compression=None):
+        if isinstance(compression, tuple):
+            method, level = compression
+        else:
+            method, level = compression, None
+
+        if method == "lz4" and importlib.util.find_spec("lz4") is None:
+            compression = "zlib" if level is None else ("zlib", level)
+
         self.compression = compression or 0
 
     @classmethod
-    def load(cls, filepath: Union[str, Path]) -> pd.DataFrame:
-        """Load dataframe from file dumped with joblib."""
-        return joblib.load(filepath)
+    def load(
+        cls, filepath: Union[str, Path], columns: Optional[List[str]] = None
+    ) -> pd.DataFrame:
+        """Load dataframe from file dumped with joblib.
+
+        Pickled dataframes can only be loaded in full, columns are selected afterwards.
+        """
+        import joblib
+
+        results = joblib.load(filepath)
+        return results if columns is None else select_columns(results, columns)
 
     def dump(self, results: pd.DataFrame, filepath: Union[str, Path]) -> None:
         """Dump dataframe with joblib."""
-        joblib.dump(results, filepath, compress=self.compression, protocol=4)
+        import joblib
+
+        joblib.dump(results, filepath, compress=self.compression, protocol=5)
+
+
+# Out-of-band buffers of pickle files start at offsets aligned for SIMD loads
+_PICKLE_ALIGNMENT = 64
+
+
+def _align(position: int) -> int:
+    return -(-position // _PICKLE_ALIGNMENT) * _PICKLE_ALIGNMENT
+
+
+class PickleSerializer(BaseSerializer):
+    """A serializer of pd.DataFrame based on pickle protocol 5.
+
+    Like joblib, it can serialize any python object. The buffers of numpy arrays
+    are written out-of-band after the pickle stream instead of being copied into
+    it, and on load arrays are rebuilt as views on the bytes read from the file.
+    Results are stored uncompressed.
+
+    The file starts with the number of out-of-band buffers, followed by the offset
+    and length of the pickle stream and of each buffer, all as little-endian
+    unsigned 64 bits integers.
+
+    Parameters
+    ----------
+    compression
+        Not supported, must be None.
+    """
+
+    fmt = "pickle"
+    extension = ".pkl"
+
+    def __init__(self, compression=None):
+        if compression is not None:
+            raise ValueError("The pickle backend does not support compression")
+        self.compression = compression
+
+    @classmethod
+    def load(
+        cls, filepath: Union[str, Path], columns: Optional[List[str]] = None
+    ) -> pd.DataFrame:
+        """Load dataframe from a pickle file with out-of-band buffers."""
+        # Read into a bytearray so that the arrays viewing it are writable
+        if hasattr(filepath, "read"):
+            contents = bytearray(filepath.read())
+        else:
+            with open(filepath, "rb") as f:
+                contents = bytearray(os.fstat(f.fileno()).st_size)
+                f.readinto(contents)
+
+        contents = memoryview(contents)
+        (n_buffers,) = struct.unpack_from("<Q", contents)
+        offsets = struct.unpack_from(f"<{2 * (n_buffers + 1)}Q", contents, 8)
+        chunks = [
+            contents[offset : offset + length]
+            for offset, length in zip(offsets[::2], offsets[1::2])
+        ]
+        results = pickle.loads(chunks[0], buffers=chunks[1:])
+        return results if columns is None else select_columns(results, columns)
+
+    def dump(self, results: pd.DataFrame, filepath: Union[str, Path]) -> None:
+        """Dump dataframe with pickle protocol 5 and out-of-band buffers."""
+        buffers = []
+        stream = pickle.dumps(results, protocol=5, buffer_callback=buffers.append)
+        chunks = [memoryview(stream)] + [buffer.raw() for buffer in buffers]
+
+        offsets = []
+        position = _align(8 + 16 * len(chunks))
+        for chunk in chunks:
+            offsets += [position, chunk.nbytes]
+            position = _align(position + chunk.nbytes)
+
+        # Files opened by the caller, e.g. in-memory buffers, are written as they are
+        if hasattr(filepath, "write"):
+            file = nullcontext(filepath)
+        else:
+            file = open(filepath, "wb")
+        with file as f:
+            f.write(struct.pack(f"<{len(offsets) + 1}Q", len(buffers), *offsets))
+            for chunk, offset in zip(chunks, offsets[::2]):
+                f.write(bytes(offset - f.tell()))
+                f.write(chunk)
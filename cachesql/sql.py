@@ -1,13 +1,17 @@
+import importlib.util
 import logging
 import time
+from collections import OrderedDict
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Any, Union
+from typing import Any, List, Optional, Tuple, Union
 
 import pandas as pd
 from sqlalchemy import create_engine
+from sqlalchemy.engine import Engine, make_url
 
 from . import __version__, store
+from .utils import select_columns
 
 logger = logging.getLogger(__name__)
 
@@ -27,13 +31,26 @@ class Database:
         If None, it will try to infer a name from the uri, otherwise it'll be set to unnameddb
     cache_store
         Path where cache should be stored or instance of derived class of store.BaseStore
-    store_backend : {'parquet', 'joblib'}
+    store_backend : {'parquet', 'joblib', 'feather', 'pickle'}
         When cache_store is a str or Path, a FileStore is used for the cache. This parameter
-        determines if it uses 'parquet' or 'joblib as backend
+        determines if it uses 'parquet', 'joblib', 'feather' or 'pickle' as backend
     normalize
         If True, normalize the queries to make the cache independent from formatting changes
     compression
         Optional compression parameter to be passed to the serializer.
+    memory_cache
+        Maximum size in bytes of an in-memory LRU cache of query results kept on top
+        of the cache store. Results are copied in and out of it, so it is safe to
+        modify returned DataFrames. Disabled by default.
+    query_backend : {'pandas', 'connectorx'}
+        Library used to fetch query results. 'connectorx' reads results straight into
+        columnar buffers with the connectorx library, which is much faster on large
+        results from the databases it supports. Falls back to 'pandas' when connectorx
+        is not installed.
+    row_group_size
+        Maximum number of rows per row group of parquet cache files. If None, the
+        default of the parquet serializer is used. Only supported by the parquet
+        store_backend.
     **kwargs
         additional kwargs to be passed to the sqlalchemy.create_engine method
     """
@@ -46,29 +63,63 @@ class Database:
         store_backend: str = "parquet",
         normalize: bool = True,
         compression: Any = None,
+        memory_cache: int = 0,
+        query_backend: str = "pandas",
+        row_group_size: Optional[int] = None,
         **kwargs,
     ):
+        if query_backend not in ("pandas", "connectorx"):
+            raise ValueError(
+                f"query_backend={query_backend!r} is invalid. "
+                f"Choose one of {'pandas', 'connectorx'}"
+            )
+        if (
+            query_backend == "connectorx"
+            and importlib.util.find_spec("connectorx") is None
+        ):
+            logger.warning("connectorx is not installed, falling back to pandas")
+            query_backend = "pandas"
+        self.query_backend = query_backend
+
         self.__dict__.update(**kwargs)
         self.kwargs = kwargs
-        self.engine = create_engine(uri, **self.kwargs)
-        self.name = name or self.engine.url.database or "unnameddb"
+        # The engine is only created when the database is first queried, so that
+        # cache hits never pay for it.
+        self.url = make_url(uri)
+        self._engine = None
+        self.name = name or self.url.database or "unnameddb"
 
         if (cache_store is None) or isinstance(cache_store, (str, Path)):
-            cache_store = Path(cache_store or ".cache").absolute() / self.name
+            cache_store = Path(cache_store or ".cache").expanduser().absolute()
             self.cache = store.FileStore(
-                cache_store=Path(cache_store),
+                cache_store=cache_store / self.name,
                 backend=store_backend,
                 normalize=normalize,
                 compression=compression,
+                row_group_size=row_group_size,
             )
 
         elif isinstance(cache_store, store.BaseStore):
             self.cache = cache_store
 
         self.session = set()
+        self.memory_cache = memory_cache
+        self._memory = OrderedDict()
+        self._memory_size = 0
+
+    @property
+    def engine(self) -> Engine:
+        """SQLAlchemy engine connected to the database, created on first access."""
+        if self._engine is None:
+            self._engine = create_engine(self.url, **self.kwargs)
+        return self._engine
 
     def query(
-        self, query: str, force: bool = False, cache: bool = True
+        self,
+        query: str,
+        force: bool = False,
+        cache: bool = True,
+        columns: Optional[List[str]] = None,
     ) -> pd.DataFrame:
         """Query the database with cache functionality.
 
@@ -83,6 +134,10 @@ class Database:
             If True, use cache mechanism. Otherwise, ignore existing cache and do not store
             in cache the results. Useful when used in production. In many situations you
             don't want to waist disk space with useless cache.
+        columns
+            If given, only return these columns of the results. On cache hits, only
+            these columns are read from disk with the parquet and feather backends.
+            The full results are always stored in cache.
 
         Returns
         -------
@@ -90,9 +145,10 @@ class Database:
             Results of the query
         """
         logger.info(f"Querying {self.name!r}")
-        if self.cache.exists(query) and not (force or not cache):
+        cached = self._try_load(query, columns) if (cache and not force) else None
+        if cached is not None:
+            results, metadata = cached
             logger.info("Loading from cache.")
-            results, metadata = self.cache.load(query)
             logger.info(
                 f"The cached query was executed on the {metadata['executed_at']} "
                 f"and lasted {timedelta(seconds=metadata['duration'])}s"
@@ -108,17 +164,82 @@ class Database:
                 metadata = {
                     "db_name": self.name,
                     "cachesql": __version__,
-                    "username": self.engine.url.username or "unknown",
+                    "username": self.url.username or "unknown",
                     "executed_at": executed_at,
                     "duration": duration,
                 }
                 self.cache.dump(query, results, metadata)
+                self._memory_put(self._memory_key(query), results, metadata)
                 logger.info("Results have been stored in cache")
 
+            if columns is not None:
+                results = select_columns(results, columns)
+
         self.session.add(query)
         return results
 
+    def _try_load(
+        self, query: str, columns: Optional[List[str]] = None
+    ) -> Optional[Tuple[pd.DataFrame, dict]]:
+        """Return cached results and metadata of a query, or None if not in cache."""
+        key = self._memory_key(query)
+        if key in self._memory:
+            results, metadata = self._memory_get(key)
+            if columns is not None:
+                results = select_columns(results, columns)
+            return results, metadata
+
+        cached = self.cache.try_load(query, columns=columns)
+        # Only full results are kept in memory
+        if cached is not None and columns is None:
+            self._memory_put(key, *cached)
+        return cached
+
+    def _memory_key(self, query: str) -> str:
+        """Return the key of a query in memory, the same as the one of the cache store.
+
+        Queries that share a cache entry once normalized also share their entry in
+        memory, so that refreshing one of them refreshes all of them.
+        """
+        return store.hash_query(
+            query, normalize=getattr(self.cache, "normalize", False)
+        )
+
+    def _memory_get(self, key: str) -> Tuple[pd.DataFrame, dict]:
+        """Return a copy of the results and metadata held in memory for a key."""
+        self._memory.move_to_end(key)
+        results, metadata, _ = self._memory[key]
+        return results.copy(), dict(metadata)
+
+    def _memory_put(self, key: str, results: pd.DataFrame, metadata: dict) -> None:
+        """Keep a copy of the results of a key in memory, evicting the LRU ones."""
+        if not self.memory_cache:
+            return
+
+        if key in self._memory:
+            self._memory_size -= self._memory.pop(key)[2]
+
+        size = int(results.memory_usage(deep=True).sum())
+        if size > self.memory_cache:
+            return
+
+        self._memory[key] = (results.copy(), dict(metadata), size)
+        self._memory_size += size
+        while self._memory_size > self.memory_cache:
+            _, (_, _, evicted_size) = self._memory.popitem(last=False)
+            self._memory_size -= evicted_size
+
     def _query(self, query: str) -> pd.DataFrame:
+        if self.query_backend == "connectorx":
+            import connectorx as cx
+
+            # connectorx expects plain URIs, without the SQLAlchemy driver name
+            url = self.url
+            uri = url.set(drivername=url.get_backend_name())
+            return cx.read_sql(
+                uri.render_as_string(hide_password=False), query, return_type="pandas"
+            )
+
         return pd.read_sql(sql=query, con=self.engine)
 
     def exists_in_cache(self, query: str) -> bool:
@@ -1,25 +1,166 @@
 import hashlib
+import io
 import json
+import logging
+import os
+import shutil
+import sqlite3
+import sys
+import threading
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import contextmanager
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Iterable, Tuple, Union
-from zipfile import ZipFile
+from typing import TYPE_CHECKING, Any, Iterable, Iterator, List, Optional, Tuple, Union
+from zipfile import ZIP_STORED, ZipFile, ZipInfo
 
 import pandas as pd
 
 from . import serializer
-from .utils import normalize_query
+from .utils import normalize_query, select_columns
 
+if TYPE_CHECKING:
+    import pyarrow as pa
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
+
+logger = logging.getLogger(__name__)
+
+# The hash is only used as a cache key, not as a security primitive.
+_sha1_kwargs = {"usedforsecurity": False} if sys.version_info >= (3, 9) else {}
+
+
+@lru_cache(maxsize=1024)
 def hash_query(query: str, normalize: bool = False) -> str:
     """Return the hash of a query. Normalized or not."""
     if normalize:
         query = normalize_query(query)
 
-    return hashlib.sha1(query.encode()).hexdigest()
+    return hashlib.sha1(query.encode(), **_sha1_kwargs).hexdigest()
+
+
+def _json_dumps(obj: Any) -> bytes:
+    """Serialize to compact JSON, with orjson if it is installed."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_SERIALIZE_NUMPY)
+    return json.dumps(obj, separators=(",", ":")).encode()
+
+
+def _json_loads(contents: bytes) -> Any:
+    """Deserialize JSON, with orjson if it is installed."""
+    if orjson is not None:
+        return orjson.loads(contents)
+    return json.loads(contents)
+
+
+@contextmanager
+def _atomic_filepath(filepath: str) -> Iterator[str]:
+    """Yield a temporary filepath that is atomically renamed to filepath on success.
+
+    Readers never see a truncated file, even if the process crashes mid-write.
+    The temporary file is unique to the writing process and thread, so that
+    concurrent writers of the same file do not clobber each other.
+    """
+    tmp_file = f"{filepath}.{os.getpid()}.{threading.get_ident()}.tmp"
+    try:
+        yield tmp_file
+        os.replace(tmp_file, filepath)
+    except BaseException:
+        if os.path.exists(tmp_file):
+            os.remove(tmp_file)
+        raise
+
+
+def _write_atomic(filepath: str, contents: bytes) -> None:
+    """Write a file through a temporary file and an atomic rename."""
+    with _atomic_filepath(filepath) as tmp_file:
+        with open(tmp_file, "wb") as f:
+            f.write(contents)
+
+
+# Files bigger than this are streamed into zip archives instead of read ahead
+_PREFETCH_MAX_SIZE = 1 << 26
+
+
+def _read_file(filepath: str) -> bytes:
+    """Return the contents of a file."""
+    with open(filepath, "rb") as f:
+        return f.read()
+
+
+def _read_small_file(filepath: str) -> Optional[bytes]:
+    """Return the contents of a file, or None if it is too big to hold in memory."""
+    if os.path.getsize(filepath) > _PREFETCH_MAX_SIZE:
+        return None
+    return _read_file(filepath)
+
+
+def _prefetch(
+    filepaths: Iterable[str], max_workers: int = 8
+) -> Iterator[Tuple[str, Optional[bytes]]]:
+    """Read files in a thread pool, keeping at most max_workers reads in flight."""
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        pending = deque()
+        for filepath in filepaths:
+            pending.append((filepath, executor.submit(_read_small_file, filepath)))
+            if len(pending) >= max_workers:
+                filepath, future = pending.popleft()
+                yield filepath, future.result()
+        for filepath, future in pending:
+            yield filepath, future.result()
+
+
+def _write_to_zip(
+    myzip: ZipFile, filepath: str, contents: Optional[bytes] = None
+) -> None:
+    """Write a file into a zip archive, streaming it in chunks of 1MB if not read yet."""
+    arcname = os.path.basename(filepath)
+    if contents is not None:
+        myzip.writestr(arcname, contents)
+        return
+
+    with open(filepath, "rb") as src, myzip.open(arcname, "w", force_zip64=True) as dst:
+        shutil.copyfileobj(src, dst, length=1 << 20)
+
+
+def _extract_atomic(myzip: ZipFile, member: ZipInfo, directory: str) -> None:
+    """Extract a zip member into directory through a temporary file and a rename."""
+    filepath = os.path.join(directory, os.path.basename(member.filename))
+    with _atomic_filepath(filepath) as tmp_file:
+        with myzip.open(member) as src, open(tmp_file, "wb") as dst:
+            shutil.copyfileobj(src, dst, length=1 << 20)
+
+
+def _serializer_kwargs(
+    backend: str, compression: Any, row_group_size: Optional[int]
+) -> dict:
+    """Return the kwargs used to create the serializer of a store backend."""
+    kwargs = {"compression": compression}
+    if row_group_size is not None:
+        if backend != "parquet":
+            raise ValueError(
+                "row_group_size is only supported by the parquet backend, "
+                f"not by store_backend={backend!r}"
+            )
+        kwargs["row_group_size"] = row_group_size
+    return kwargs
 
 
 class BaseStore:
-    pass
+    def try_load(
+        self, query: str, columns: Optional[List[str]] = None
+    ) -> Optional[Tuple[pd.DataFrame, dict]]:
+        """Load results and metadata for a query, or return None if not in cache."""
+        if not self.exists(query):
+            return None
+        results, metadata = self.load(query)
+        if columns is not None:
+            results = select_columns(results, columns)
+        return results, metadata
 
 
 class FileStore(BaseStore):
@@ -34,12 +175,24 @@ class FileStore(BaseStore):
         formatting changes. Normalization is done with the sqlparse library.
     compression
         Optional compression parameter to be passed to the serializer.
+    background_dump
+        If True, :py:meth:`dump` returns immediately and results are written to disk
+        by a background thread, overlapping the write with whatever the caller does
+        next. Results are copied before being handed to the thread. Reads of a query
+        being dumped wait for its write to finish, and :py:meth:`flush` waits for
+        all pending writes.
+    row_group_size
+        Maximum number of rows per row group of parquet files. If None, the
+        default of :py:class:`serializer.ParquetSerializer` is used. Only supported
+        by the parquet backend.
 
     """
 
     _serializers = {
         "parquet": serializer.ParquetSerializer,
         "joblib": serializer.JoblibSerializer,
+        "feather": serializer.FeatherSerializer,
+        "pickle": serializer.PickleSerializer,
     }
 
     def __init__(
@@ -48,75 +201,189 @@ class FileStore(BaseStore):
         backend: str = "parquet",
         normalize: bool = False,
         compression: Any = None,
+        background_dump: bool = False,
+        row_group_size: Optional[int] = None,
     ) -> None:
         if backend not in self._serializers:
             raise ValueError(
-                f"store_backend={backend!r} is invalid. Choose one of {'parquet', 'joblib'}"
+                f"store_backend={backend!r} is invalid. "
+                f"Choose one of {list(self._serializers)}"
             )
-        self.serializer = self._serializers[backend](compression=compression)
+        self.serializer = self._serializers[backend](
+            **_serializer_kwargs(backend, compression, row_group_size)
+        )
         self.cache_store = Path(cache_store).expanduser() / self.serializer.fmt
         self.cache_store.mkdir(parents=True, exist_ok=True)
         self.normalize = normalize
+        # Internal filepaths are built as plain strings, which is much cheaper
+        # than Path arithmetic on every cache lookup.
+        self._root = os.path.join(str(self.cache_store), "")
+        self._dump_pool = ThreadPoolExecutor(max_workers=1) if background_dump else None
+        self._pending_dumps = {}
+        # Pending dumps are registered by callers and removed by the dump thread
+        self._pending_lock = threading.Lock()
 
     def exists(self, query: str) -> bool:
         """Return True if the results of the given query exist in cache."""
-        metadata_file = self.get_metadata_filepath(query)
-        cache_file = self.get_cache_filepath(query)
-        return metadata_file.exists() and cache_file.exists()
+        metadata_file, cache_file = self._get_filepaths(query)
+        self._wait_for_dump(metadata_file)
+        try:
+            os.stat(cache_file)
+            os.stat(metadata_file)
+        except FileNotFoundError:
+            return False
+        return True
+
+    def _get_filepaths(self, query: str) -> Tuple[str, str]:
+        """Return the metadata and cached results filepaths of a query as strings."""
+        root = self._root + hash_query(query, normalize=self.normalize)
+        return root + ".json", root + self.serializer.extension
 
     def get_metadata_filepath(self, query: str) -> Path:
         """Return the metadata filepath corresponding to that query."""
-        arg_hash = hash_query(query, normalize=self.normalize)
-        return self.cache_store / (arg_hash + ".json")
+        return Path(self._get_filepaths(query)[0])
 
     def get_cache_filepath(self, query: str) -> Path:
         """Return the cached results filepath corresponding to that query."""
-        arg_hash = hash_query(query, normalize=self.normalize)
-        return self.cache_store / (arg_hash + self.serializer.extension)
+        return Path(self._get_filepaths(query)[1])
 
     def load_metadata(self, query: str) -> dict:
         """Load metadata of cached results for query if it exists in cache."""
-        metadata_file = self.get_metadata_filepath(query)
-        if metadata_file.exists():
-            return json.loads(metadata_file.read_text())
-        else:
+        metadata_file = self._get_filepaths(query)[0]
+        self._wait_for_dump(metadata_file)
+        try:
+            with open(metadata_file, "rb") as f:
+                return _json_loads(f.read())
+        except FileNotFoundError:
             raise ValueError("Metadata for the given query does not exist.")
 
-    def load_results(self, query: str) -> pd.DataFrame:
-        """Load cached results for query if it exists in cache."""
-        cache_file = self.get_cache_filepath(query)
-        if cache_file.exists():
-            return self.serializer.load(cache_file)
-        else:
+    def load_results(
+        self, query: str, columns: Optional[List[str]] = None
+    ) -> pd.DataFrame:
+        """Load cached results for query if it exists in cache.
+
+        If columns is given, only those columns are loaded.
+        """
+        metadata_file, cache_file = self._get_filepaths(query)
+        self._wait_for_dump(metadata_file)
+        try:
+            return self.serializer.load(cache_file, columns=columns)
+        except FileNotFoundError:
+            raise ValueError("Cached results for the given query do not exist.")
+
+    def load_results_arrow(
+        self, query: str, columns: Optional[List[str]] = None
+    ) -> "pa.Table":
+        """Load cached results for query as an Arrow table, if it exists in cache.
+
+        Useful for Arrow-native consumers (e.g. polars, duckdb), which can then
+        skip the conversion to pandas.
+        """
+        metadata_file, cache_file = self._get_filepaths(query)
+        self._wait_for_dump(metadata_file)
+        try:
+            return self.serializer.load_table(cache_file, columns=columns)
+        except FileNotFoundError:
             raise ValueError("Cached results for the given query do not exist.")
 
     def load(self, query: str) -> Tuple[pd.DataFrame, dict]:
         """Load results and metadata for a query if they exist in cache."""
         return self.load_results(query), self.load_metadata(query)
 
+    def try_load(
+        self, query: str, columns: Optional[List[str]] = None
+    ) -> Optional[Tuple[pd.DataFrame, dict]]:
+        """Load results and metadata for a query, or return None if not in cache.
+
+        Files are opened directly instead of checking for their existence first,
+        which saves the stat calls done by :py:meth:`exists`. If columns is given,
+        only those columns of the results are loaded.
+        """
+        metadata_file, cache_file = self._get_filepaths(query)
+        self._wait_for_dump(metadata_file)
+        try:
+            with open(metadata_file, "rb") as f:
+                metadata = _json_loads(f.read())
+            results = self.serializer.load(cache_file, columns=columns)
+        except FileNotFoundError:
+            return None
+        return results, metadata
+
     def dump_metadata(self, query: str, metadata: dict) -> None:
         """Dump metadata of query results to cache."""
-        metadata["cache_file"] = self.get_cache_filepath(query).name
+        metadata_file = self._get_filepaths(query)[0]
+        self._add_store_metadata(query, metadata)
+        _write_atomic(metadata_file, _json_dumps(metadata))
+
+    def _add_store_metadata(self, query: str, metadata: dict) -> None:
+        """Add the cache file and the stored query to metadata, in place."""
+        cache_file = self._get_filepaths(query)[1]
+        metadata["cache_file"] = os.path.basename(cache_file)
         metadata["query"] = normalize_query(query) if self.normalize else query
-        metadata_file = self.get_metadata_filepath(query)
-        metadata_file.write_text(json.dumps(metadata, indent=True))
 
     def dump_results(self, query: str, results: pd.DataFrame) -> None:
         """Dump query results to cache."""
-        cache_file = self.get_cache_filepath(query)
-        self.serializer.dump(results, cache_file)
+        cache_file = self._get_filepaths(query)[1]
+        with _atomic_filepath(cache_file) as tmp_file:
+            self.serializer.dump(results, tmp_file)
 
     def dump(self, query: str, results: pd.DataFrame, metadata: dict) -> None:
         """Dump results and metadata for given query to cache."""
+        if self._dump_pool is None:
+            self._dump(query, results, metadata)
+            return
+
+        # The caller's metadata gets the same keys as with a synchronous dump
+        self._add_store_metadata(query, metadata)
+        key = self._get_filepaths(query)[0]
+        future = self._dump_pool.submit(
+            self._dump, query, results.copy(), dict(metadata)
+        )
+        with self._pending_lock:
+            self._pending_dumps[key] = future
+        future.add_done_callback(lambda f: self._dump_done(key, f))
+
+    def _dump(self, query: str, results: pd.DataFrame, metadata: dict) -> None:
+        # Both files are renamed into place once fully written, metadata last.
+        # A metadata file is thus only ever visible next to complete results.
         self.dump_results(query, results)
         self.dump_metadata(query, metadata)
 
+    def _dump_done(self, key: str, future: Future) -> None:
+        # A newer dump of the same query may have been registered meanwhile
+        with self._pending_lock:
+            if self._pending_dumps.get(key) is future:
+                del self._pending_dumps[key]
+        if future.exception() is not None:
+            logger.error("Background dump to cache failed", exc_info=future.exception())
+
+    def _wait_for_dump(self, key: str) -> None:
+        """Wait for a pending background dump of the given metadata file."""
+        with self._pending_lock:
+            future = self._pending_dumps.get(key)
+        if future is not None:
+            future.exception()
+
+    def flush(self) -> None:
+        """Wait for all pending background dumps to be written to disk."""
+        if self._dump_pool is not None:
+            # Dumps run one at a time in submission order
+            self._dump_pool.submit(lambda: None).result()
+
     def list(self) -> pd.DataFrame:
         """List cached function calls with some useful metadata."""
-        # List everything first
-        cache_list = [
-            json.loads(f.read_text()) for f in self.cache_store.glob("*.json")
-        ]
+        self.flush()
+        # List everything first with a single directory scan
+        with os.scandir(self.cache_store) as entries:
+            metadata_files = [e.path for e in entries if e.name.endswith(".json")]
+
+        # Files are read concurrently in threads, which release the GIL while
+        # waiting on I/O. Parsing is cheap and stays on the calling thread.
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            cache_list = [
+                _json_loads(contents)
+                for contents in executor.map(_read_file, metadata_files)
+            ]
 
         if len(cache_list) == 0:
             default_metadata = [
@@ -127,7 +394,7 @@ class FileStore(BaseStore):
             ]
             return pd.DataFrame(columns=default_metadata)
 
-        return pd.DataFrame(cache_list)
+        return pd.DataFrame.from_records(cache_list)
 
     def export(self, filename: Union[str, Path], queries: Iterable = None) -> None:
         """Export contents of cache to a zip file.
@@ -145,15 +412,23 @@ class FileStore(BaseStore):
             List of queries to be exported (Optional). If None, all cache contents will
             be exported.
         """
+        self.flush()
         queries = queries or self.list().loc[:, "query"]
         filename = Path(filename)
         filename = filename.with_suffix(".zip") if filename.suffix == "" else filename
-        with ZipFile(filename, "w") as myzip:
+
+        def filepaths():
             for query in queries:
-                cache_file = self.get_cache_filepath(query)
-                metadata_file = self.get_metadata_filepath(query)
-                myzip.write(str(cache_file), arcname=Path(cache_file).name)
-                myzip.write(str(metadata_file), arcname=Path(metadata_file).name)
+                metadata_file, cache_file = self._get_filepaths(query)
+                yield cache_file
+                yield metadata_file
+
+        # Files are read ahead in threads while the zip is written sequentially,
+        # ZipFile does not support concurrent writes. Cached results are already
+        # compressed, store them as they are.
+        with ZipFile(filename, "w", compression=ZIP_STORED, allowZip64=True) as myzip:
+            for filepath, contents in _prefetch(filepaths()):
+                _write_to_zip(myzip, filepath, contents)
 
     def import_cache(self, filename: Union[str, Path]) -> None:
         """Import contents to cache.
@@ -163,10 +438,236 @@ class FileStore(BaseStore):
         your code. Or you can simply use it to migrate your cache from one environment to the
         other.
 
+        Parameters
+        ----------
+        filename : Union[str, Path]
+            Path to a zip file containing a previously exported cache
+        """
+        self.flush()
+        # Members are extracted concurrently, reads from the archive are
+        # serialized by ZipFile while the writes to disk overlap. Each file is
+        # renamed into place once complete, and metadata files are extracted after
+        # all results, so that they are only ever visible next to complete results.
+        with ZipFile(filename, "r") as myzip:
+            members = [member for member in myzip.infolist() if not member.is_dir()]
+            metadata = [m for m in members if m.filename.endswith(".json")]
+            results = [m for m in members if not m.filename.endswith(".json")]
+            with ThreadPoolExecutor(max_workers=8) as executor:
+                for batch in (results, metadata):
+                    futures = [
+                        executor.submit(
+                            _extract_atomic, myzip, member, str(self.cache_store)
+                        )
+                        for member in batch
+                    ]
+                    for future in futures:
+                        future.result()
+
+
+class SQLiteStore(BaseStore):
+    """Store of cached results and metadata as rows of a single SQLite database.
+
+    Each query is kept in one row of a ``cache.sqlite`` file instead of two files,
+    which saves per-file overhead on filesystems where it is expensive. Exported
+    zip files have the same layout as the ones of :py:class:`FileStore`, so caches
+    can be moved from one store to the other. The connection to the database stays
+    open until :py:meth:`close` is called, or the store is used as a context manager.
+
+    Parameters
+    ----------
+    cache_store
+        Root path where the SQLite database is stored.
+    backend : {'parquet', 'joblib', 'feather', 'pickle'}
+        Serializer used to dump results into the database.
+    normalize
+        If True, normalize the queries to make the cache independent from
+        formatting changes. Normalization is done with the sqlparse library.
+    compression
+        Optional compression parameter to be passed to the serializer.
+    row_group_size
+        Maximum number of rows per row group of parquet files. If None, the
+        default of :py:class:`serializer.ParquetSerializer` is used. Only supported
+        by the parquet backend.
+
+    """
+
+    _serializers = FileStore._serializers
+
+    def __init__(
+        self,
+        cache_store: Path,
+        backend: str = "parquet",
+        normalize: bool = False,
+        compression: Any = None,
+        row_group_size: Optional[int] = None,
+    ) -> None:
+        if backend not in self._serializers:
+            raise ValueError(
+                f"store_backend={backend!r} is invalid. "
+                f"Choose one of {list(self._serializers)}"
+            )
+        self.serializer = self._serializers[backend](
+            **_serializer_kwargs(backend, compression, row_group_size)
+        )
+        self.cache_store = Path(cache_store).expanduser() / self.serializer.fmt
+        self.cache_store.mkdir(parents=True, exist_ok=True)
+        self.normalize = normalize
+        self.database = self.cache_store / "cache.sqlite"
+        # A single connection is shared by all threads, guarded by a lock
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(self.database, check_same_thread=False)
+        with self._lock, self._connection:
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS cache"
+                "(hash TEXT PRIMARY KEY, metadata BLOB, results BLOB)"
+            )
+
+    def close(self) -> None:
+        """Close the connection to the SQLite database."""
+        with self._lock:
+            self._connection.close()
+
+    def __enter__(self) -> "SQLiteStore":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def _execute(self, sql: str, parameters: tuple = ()) -> list:
+        """Execute a statement in a transaction and return all its rows."""
+        with self._lock, self._connection:
+            return self._connection.execute(sql, parameters).fetchall()
+
+    def _fetch(self, query: str, columns: str) -> Optional[tuple]:
+        """Return the given columns of the row of a query, or None if not in cache."""
+        rows = self._execute(
+            f"SELECT {columns} FROM cache WHERE hash = ?",
+            (hash_query(query, normalize=self.normalize),),
+        )
+        return rows[0] if rows else None
+
+    def exists(self, query: str) -> bool:
+        """Return True if the results of the given query exist in cache."""
+        return self._fetch(query, "1") is not None
+
+    def load_metadata(self, query: str) -> dict:
+        """Load metadata of cached results for query if it exists in cache."""
+        row = self._fetch(query, "metadata")
+        if row is None:
+            raise ValueError("Metadata for the given query does not exist.")
+        return _json_loads(row[0])
+
+    def load_results(
+        self, query: str, columns: Optional[List[str]] = None
+    ) -> pd.DataFrame:
+        """Load cached results for query if it exists in cache.
+
+        If columns is given, only those columns are loaded.
+        """
+        row = self._fetch(query, "results")
+        if row is None:
+            raise ValueError("Cached results for the given query do not exist.")
+        return self.serializer.load(io.BytesIO(row[0]), columns=columns)
+
+    def load_results_arrow(
+        self, query: str, columns: Optional[List[str]] = None
+    ) -> "pa.Table":
+        """Load cached results for query as an Arrow table, if it exists in cache."""
+        row = self._fetch(query, "results")
+        if row is None:
+            raise ValueError("Cached results for the given query do not exist.")
+        return self.serializer.load_table(io.BytesIO(row[0]), columns=columns)
+
+    def load(self, query: str) -> Tuple[pd.DataFrame, dict]:
+        """Load results and metadata for a query if they exist in cache."""
+        cached = self.try_load(query)
+        if cached is None:
+            raise ValueError("Cached results for the given query do not exist.")
+        return cached
+
+    def try_load(
+        self, query: str, columns: Optional[List[str]] = None
+    ) -> Optional[Tuple[pd.DataFrame, dict]]:
+        """Load results and metadata for a query, or return None if not in cache."""
+        row = self._fetch(query, "results, metadata")
+        if row is None:
+            return None
+        results = self.serializer.load(io.BytesIO(row[0]), columns=columns)
+        return results, _json_loads(row[1])
+
+    def dump(self, query: str, results: pd.DataFrame, metadata: dict) -> None:
+        """Dump results and metadata for given query to cache."""
+        query_hash = hash_query(query, normalize=self.normalize)
+        metadata["cache_file"] = query_hash + self.serializer.extension
+        metadata["query"] = normalize_query(query) if self.normalize else query
+        buffer = io.BytesIO()
+        self.serializer.dump(results, buffer)
+        self._insert(query_hash, _json_dumps(metadata), buffer.getvalue())
+
+    def _insert(self, query_hash: str, metadata: bytes, results: bytes) -> None:
+        self._execute(
+            "INSERT OR REPLACE INTO cache(hash, metadata, results) VALUES (?, ?, ?)",
+            (query_hash, metadata, results),
+        )
+
+    def list(self) -> pd.DataFrame:
+        """List cached function calls with some useful metadata."""
+        cache_list = [
+            _json_loads(metadata)
+            for metadata, in self._execute("SELECT metadata FROM cache")
+        ]
+
+        if len(cache_list) == 0:
+            default_metadata = [
+                "query",
+                "cache_file",
+                "executed_at",
+                "duration",
+            ]
+            return pd.DataFrame(columns=default_metadata)
+
+        return pd.DataFrame.from_records(cache_list)
+
+    def export(self, filename: Union[str, Path], queries: Iterable = None) -> None:
+        """Export contents of cache to a zip file.
+
+        The zip file has the same layout as the ones exported by
+        :py:meth:`FileStore.export <FileStore.export>`.
+
+        Parameters
+        ----------
+        filename
+            Path to a zip file where cache will be exported
+        queries
+            List of queries to be exported (Optional). If None, all cache contents will
+            be exported.
+        """
+        queries = queries or self.list().loc[:, "query"]
+        filename = Path(filename)
+        filename = filename.with_suffix(".zip") if filename.suffix == "" else filename
+
+        with ZipFile(filename, "w", compression=ZIP_STORED, allowZip64=True) as myzip:
+            for query in queries:
+                query_hash = hash_query(query, normalize=self.normalize)
+                row = self._fetch(query, "results, metadata")
+                if row is None:
+                    raise ValueError("Cached results for the given query do not exist.")
+                myzip.writestr(query_hash + self.serializer.extension, row[0])
+                myzip.writestr(query_hash + ".json", row[1])
+
+    def import_cache(self, filename: Union[str, Path]) -> None:
+        """Import contents to cache.
+
         Parameters
         ----------
         filename : Union[str, Path]
             Path to a zip file containing a previously exported cache
         """
         with ZipFile(filename, "r") as myzip:
-            myzip.extractall(path=self.cache_store)
+            names = set(myzip.namelist())
+            for name in names:
+                query_hash, extension = os.path.splitext(name)
+                cache_file = query_hash + self.serializer.extension
+                if extension != ".json" or cache_file not in names:
+                    continue
+                self._insert(query_hash, myzip.read(name), myzip.read(cache_file))
@@ -1,10 +1,31 @@
 import logging
 from functools import lru_cache
+from typing import Iterable, List
 
-import sqlparse
+import pandas as pd
+from sqlparse import engine, filters, formatter
 
 logger = logging.getLogger(__name__)
 
+# Formatting options are validated once. Filter stacks are still built for each
+# query since sqlparse filters keep state from one statement to the next.
+_FORMAT_OPTIONS = formatter.validate_options(
+    {
+        "reindent": True,
+        "indent_tabs": False,
+        "indent_width": 4,
+        "keyword_case": "upper",
+        "strip_comments": True,
+    }
+)
+
+
+def _format(query: str) -> str:
+    """Equivalent of sqlparse.format with the options above."""
+    stack = formatter.build_filter_stack(engine.FilterStack(), _FORMAT_OPTIONS)
+    stack.postprocess.append(filters.SerializerUnicode())
+    return "".join(stack.run(query))
+
 
 @lru_cache(maxsize=1024)
 def normalize_query(query: str, max_length=40000) -> str:
@@ -24,11 +45,18 @@ def normalize_query(query: str, max_length=40000) -> str:
         )
         return query
     else:
-        return sqlparse.format(
-            query.strip(),
-            reindent=True,
-            indent_tabs=False,
-            indent_width=4,
-            keyword_case="upper",
-            strip_comments=True,
-        )
+        return _format(query.strip())
+
+
+def check_columns(columns: List[str], available: Iterable[str]) -> None:
+    """Raise a KeyError if some of the requested columns are not available."""
+    available = set(available)
+    missing = [column for column in columns if column not in available]
+    if missing:
+        raise KeyError(f"Columns {missing} are not in the results of the query")
+
+
+def select_columns(results: pd.DataFrame, columns: List[str]) -> pd.DataFrame:
+    """Return the requested columns of results, checked with check_columns."""
+    check_columns(columns, results.columns)
+    return results.loc[:, columns]
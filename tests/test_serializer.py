@@ -1,3 +1,4 @@
+from unittest.mock import patch
 from uuid import uuid1
 
 import pandas as pd
@@ -6,10 +7,58 @@ import pytest
 from cachesql import serializer
 
 
+@pytest.mark.parametrize(
+    "serializer_class",
+    [
+        serializer.ParquetSerializer,
+        serializer.FeatherSerializer,
+        serializer.JoblibSerializer,
+        serializer.PickleSerializer,
+    ],
+)
+def test_load_columns(tmp_path, results, serializer_class):
+    s = serializer_class()
+    s.dump(results, tmp_path / "file")
+    assert results[["c", "a"]].equals(s.load(tmp_path / "file", columns=["c", "a"]))
+
+    with pytest.raises(KeyError) as excinfo:
+        s.load(tmp_path / "file", columns=["a", "zz"])
+    assert "['zz']" in str(excinfo.value)
+
+
+@pytest.mark.parametrize(
+    "serializer_class",
+    [
+        serializer.ParquetSerializer,
+        serializer.FeatherSerializer,
+        serializer.JoblibSerializer,
+        serializer.PickleSerializer,
+    ],
+)
+def test_load_table(tmp_path, results, serializer_class):
+    s = serializer_class()
+    s.dump(results, tmp_path / "file")
+    table = s.load_table(tmp_path / "file", columns=["a", "b"])
+    assert table.column_names == ["a", "b"]
+    assert results[["a", "b"]].equals(table.to_pandas())
+
+
 class TestParquetSerializer:
     def test_init_compression_is_none(self):
         s = serializer.ParquetSerializer()
+        assert s.compression == "zstd"
+        assert s.compression_level == 3
+
+    def test_init_compression_with_level(self, tmp_path, results):
+        s = serializer.ParquetSerializer(compression=("zstd", 9))
+        assert s.compression == "zstd"
+        assert s.compression_level == 9
+        s.dump(results, tmp_path / "file.parquet")
+        assert results.equals(s.load(tmp_path / "file.parquet"))
+
+        s = serializer.ParquetSerializer(compression="snappy")
         assert s.compression == "snappy"
+        assert s.compression_level is None
 
     def test_dump_load_results(self, tmp_path, results):
         s = serializer.ParquetSerializer()
@@ -18,6 +67,38 @@ class TestParquetSerializer:
         results_loaded = s.load(tmp_path / "file.parquet")
         assert results.equals(results_loaded)
 
+    @pytest.mark.parametrize("compression", [None, "none"])
+    def test_loaded_results_are_writable(self, tmp_path, results, compression):
+        s = serializer.ParquetSerializer(compression=compression)
+        s.dump(results, tmp_path / "file.parquet")
+        results_loaded = s.load(tmp_path / "file.parquet")
+        results_loaded.loc[0, "a"] = 10
+        assert results_loaded.loc[0, "a"] == 10
+
+    def test_row_group_size(self, tmp_path, results):
+        import pyarrow.parquet as pq
+
+        s = serializer.ParquetSerializer()
+        assert s.row_group_size is None
+        s.dump(results, tmp_path / "file.parquet")
+        assert pq.ParquetFile(tmp_path / "file.parquet").num_row_groups == 1
+
+        s = serializer.ParquetSerializer(row_group_size=1)
+        s.dump(results, tmp_path / "file.parquet")
+        assert pq.ParquetFile(tmp_path / "file.parquet").num_row_groups == 2
+        assert results.equals(s.load(tmp_path / "file.parquet"))
+
+    def test_range_index_is_not_written(self, tmp_path, results):
+        import pyarrow.parquet as pq
+
+        s = serializer.ParquetSerializer()
+        s.dump(results, tmp_path / "file.parquet")
+        assert pq.read_schema(tmp_path / "file.parquet").names == ["a", "b", "c"]
+
+        indexed_results = results.set_index("a")
+        s.dump(indexed_results, tmp_path / "indexed.parquet")
+        assert indexed_results.equals(s.load(tmp_path / "indexed.parquet"))
+
     def test_invalid_arrow_type(self, tmp_path):
         s = serializer.ParquetSerializer()
         results = pd.Series([uuid1() for i in range(3)], name="uuid_col").to_frame()
@@ -26,6 +107,35 @@ class TestParquetSerializer:
         assert "Database(uri='...', store_backend='joblib')" in str(excinfo.value)
 
 
+class TestFeatherSerializer:
+    def test_init_compression_is_none(self):
+        s = serializer.FeatherSerializer()
+        assert s.compression == "lz4"
+        assert s.compression_level is None
+
+    def test_dump_load_results(self, tmp_path, results):
+        s = serializer.FeatherSerializer(compression=("zstd", 1))
+        s.dump(results, tmp_path / "file.feather")
+        assert (tmp_path / "file.feather").exists()
+        results_loaded = s.load(tmp_path / "file.feather")
+        assert results.equals(results_loaded)
+
+    @pytest.mark.parametrize("compression", [None, "uncompressed"])
+    def test_loaded_results_are_writable(self, tmp_path, results, compression):
+        s = serializer.FeatherSerializer(compression=compression)
+        s.dump(results, tmp_path / "file.feather")
+        results_loaded = s.load(tmp_path / "file.feather")
+        results_loaded.loc[0, "a"] = 10
+        assert results_loaded.loc[0, "a"] == 10
+
+    def test_invalid_arrow_type(self, tmp_path):
+        s = serializer.FeatherSerializer()
+        results = pd.Series([uuid1() for i in range(3)], name="uuid_col").to_frame()
+        with pytest.raises(ValueError) as excinfo:
+            s.dump(results, tmp_path / "file.feather")
+        assert "Database(uri='...', store_backend='joblib')" in str(excinfo.value)
+
+
 class TestJoblibSerializer:
     def test_init_compression_is_none(self):
         s = serializer.JoblibSerializer()
@@ -37,3 +147,38 @@ class TestJoblibSerializer:
         assert (tmp_path / "file.parquet").exists()
         results_loaded = s.load(tmp_path / "file.parquet")
         assert results.equals(results_loaded)
+
+    @pytest.mark.parametrize("compression", ["lz4", ("lz4", 1)])
+    def test_lz4_compression(self, tmp_path, results, compression):
+        pytest.importorskip("lz4")
+        s = serializer.JoblibSerializer(compression=compression)
+        assert s.compression == compression
+        s.dump(results, tmp_path / "file.joblib")
+        results_loaded = s.load(tmp_path / "file.joblib")
+        assert results.equals(results_loaded)
+
+    def test_lz4_compression_fallback(self, tmp_path, results):
+        with patch.object(serializer.importlib.util, "find_spec", return_value=None):
+            assert serializer.JoblibSerializer("lz4").compression == "zlib"
+            s = serializer.JoblibSerializer(("lz4", 1))
+            assert s.compression == ("zlib", 1)
+        s.dump(results, tmp_path / "file.joblib")
+        assert results.equals(s.load(tmp_path / "file.joblib"))
+
+
+class TestPickleSerializer:
+    def test_init_compression(self):
+        assert serializer.PickleSerializer().compression is None
+        with pytest.raises(ValueError):
+            serializer.PickleSerializer(compression="zlib")
+
+    def test_dump_load_results(self, tmp_path, results):
+        s = serializer.PickleSerializer()
+        results = results.assign(uuid_col=[uuid1() for i in range(len(results))])
+        s.dump(results, tmp_path / "file.pkl")
+        results_loaded = s.load(tmp_path / "file.pkl")
+        assert results.equals(results_loaded)
+
+        # Arrays are views on the loaded file, which must remain writable
+        results_loaded.loc[0, "a"] = 10
+        assert results_loaded.loc[0, "a"] == 10
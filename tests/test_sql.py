@@ -1,6 +1,9 @@
 import os
+import sys
+from importlib.machinery import ModuleSpec
 from pathlib import Path
-from unittest.mock import patch
+from types import ModuleType
+from unittest.mock import MagicMock, patch
 
 import pandas as pd
 import pytest
@@ -50,6 +53,21 @@ class TestDBConnector:
         )
         assert isinstance(db.cache.serializer, serializer.ParquetSerializer)
 
+    def test_instantiate_with_cache_store_in_home(
+        self, mock_read_sql, tmp_path, monkeypatch
+    ):
+        monkeypatch.setenv("HOME", str(tmp_path))
+        monkeypatch.setenv("USERPROFILE", str(tmp_path))
+        db = sql.Database(
+            name="home_as_cache",
+            uri="sqlite:///file:path/to/database1a?mode=ro&uri=true",
+            cache_store="~/.cache",
+        )
+        assert (
+            db.cache.cache_store
+            == tmp_path / ".cache" / "home_as_cache" / db.cache.serializer.fmt
+        )
+
     def test_instantiate_with_cache_store_as_none(self, mock_read_sql, tmp_path):
         previous_wd = os.getcwd()
 
@@ -64,7 +82,7 @@ class TestDBConnector:
             == tmp_path / ".cache" / "none_as_cache" / db.cache.serializer.fmt
         )
         assert isinstance(db.cache.serializer, serializer.ParquetSerializer)
-        assert db.cache.serializer.compression == "snappy"
+        assert db.cache.serializer.compression == "zstd"
         os.chdir(previous_wd)
 
     def test_instantiate_with_store_backend_joblib(self, mock_read_sql, tmp_path):
@@ -95,6 +113,50 @@ class TestDBConnector:
             )
         assert "store_backend='wrong' is invalid" in str(excinfo.value)
 
+    def test_instantiate_with_row_group_size(self, mock_read_sql, tmp_path):
+        db = sql.Database(
+            uri="sqlite:///file:path/to/database1a?mode=ro&uri=true",
+            cache_store=tmp_path,
+            row_group_size=1000,
+        )
+        assert db.cache.serializer.row_group_size == 1000
+
+    def test_instantiate_with_query_backend_wrong(self, mock_read_sql, tmp_path):
+        with pytest.raises(ValueError) as excinfo:
+            _ = sql.Database(
+                uri="sqlite:///file:path/to/database1a?mode=ro&uri=true",
+                cache_store=tmp_path,
+                query_backend="wrong",
+            )
+        assert "query_backend='wrong' is invalid" in str(excinfo.value)
+
+    def test_query_backend_connectorx(self, mock_read_sql, tmp_path, query):
+        connectorx = ModuleType("connectorx")
+        connectorx.__spec__ = ModuleSpec("connectorx", None)
+        connectorx.read_sql = MagicMock()
+        with patch.dict(sys.modules, {"connectorx": connectorx}):
+            db = sql.Database(
+                uri="sqlite+pysqlite:///mydb.db",
+                cache_store=tmp_path,
+                query_backend="connectorx",
+            )
+            assert db.query_backend == "connectorx"
+            _ = db._query(query)
+
+        connectorx.read_sql.assert_called_once_with(
+            "sqlite:///mydb.db", query, return_type="pandas"
+        )
+        mock_read_sql.assert_not_called()
+
+    def test_query_backend_connectorx_not_installed(self, mock_read_sql, tmp_path):
+        with patch.object(sql.importlib.util, "find_spec", return_value=None):
+            db = sql.Database(
+                uri="sqlite:///file:path/to/database1a?mode=ro&uri=true",
+                cache_store=tmp_path,
+                query_backend="connectorx",
+            )
+        assert db.query_backend == "pandas"
+
     def test_instantiate_with_cache_store_as_parquet_store(
         self, mock_read_sql, tmp_path
     ):
@@ -208,6 +270,91 @@ class TestDBConnector:
         assert "executed_at" in metadata
         assert "duration" in metadata
 
+    def test_query_columns(self, mock_read_sql, db, query):
+        df = db.query(query=query)
+        assert db.query(query=query, columns=["query_hash"]).equals(df[["query_hash"]])
+        assert mock_read_sql.call_count == 1
+
+        df = db.query(query=query, columns=["query_hash"], force=True)
+        assert list(df.columns) == ["query_hash"]
+        assert list(db.cache.load_results(query).columns) == ["query", "query_hash"]
+
+        # Unknown columns raise the same error on cache hits and misses
+        for force in (False, True):
+            with pytest.raises(KeyError):
+                db.query(query=query, columns=["zz"], force=force)
+
+    def test_engine_is_created_on_first_query(self, mock_read_sql, tmp_path, query):
+        uri = "sqlite:///file:path/to/database1a?mode=ro&uri=true"
+        db = sql.Database(name="lazy_engine", uri=uri, cache_store=tmp_path)
+        assert db._engine is None
+        _ = db.query(query=query)
+        assert db._engine is not None
+
+        db = sql.Database(name="lazy_engine", uri=uri, cache_store=tmp_path)
+        _ = db.query(query=query)
+        assert mock_read_sql.call_count == 1
+        assert db._engine is None, "Cache hits should not create the engine"
+
+    def test_memory_cache(self, mock_read_sql, tmp_path, query):
+        db = sql.Database(
+            name="memory_cache",
+            uri="sqlite:///file:path/to/database1a?mode=ro&uri=true",
+            cache_store=tmp_path,
+            memory_cache=1 << 20,
+        )
+        df1 = db.query(query=query)
+        assert db._memory_key(query) in db._memory
+
+        with patch.object(db.cache, "try_load") as mock_try_load:
+            df2 = db.query(query=query)
+            mock_try_load.assert_not_called()
+        assert mock_read_sql.call_count == 1
+        assert df1.equals(df2)
+
+        # Results handed to the caller are copies of the ones kept in memory
+        df2.loc[0, "query"] = "modified"
+        assert db.query(query=query).equals(df1)
+
+    def test_memory_cache_shared_by_equivalent_queries(self, mock_read_sql, tmp_path):
+        db = sql.Database(
+            name="memory_cache_normalized",
+            uri="sqlite:///file:path/to/database1a?mode=ro&uri=true",
+            cache_store=tmp_path,
+            memory_cache=1 << 20,
+        )
+        query1 = "SELECT top 3 * FROM receipts"
+        query2 = "select top 3 * from receipts"
+        _ = db.query(query=query1)
+
+        mock_read_sql.side_effect = lambda sql, con=None: pd.DataFrame({"a": [2]})
+        df = db.query(query=query2, force=True)
+        assert db.query(query=query1).equals(df), "Stale results served from memory"
+        assert db.cache.load_results(query1).equals(df)
+        assert len(db._memory) == 1
+
+    def test_memory_cache_eviction(self, mock_read_sql, tmp_path):
+        db = sql.Database(
+            name="memory_cache_eviction",
+            uri="sqlite:///file:path/to/database1a?mode=ro&uri=true",
+            cache_store=tmp_path,
+            memory_cache=1,
+        )
+        _ = db.query(query="select top 10 * from Receipts")
+        assert len(db._memory) == 0, "Results bigger than the budget are not kept"
+
+        db.memory_cache = 1 << 20
+        queries = [f"select top {i} * from Receipts" for i in range(3)]
+        keys = [db._memory_key(query) for query in queries]
+        for query in queries:
+            _ = db.query(query=query)
+        assert list(db._memory) == keys
+
+        db.memory_cache = db._memory[keys[0]][2] * 2
+        _ = db.query(query=queries[0], force=True)
+        assert list(db._memory) == keys[2:] + keys[:1]
+        assert db._memory_size <= db.memory_cache
+
     def test_querydb_independent_from_format(self, mock_read_sql, db):
         query1 = "select top 3 * from receipts"
         query2 = "SELECT top 3 * FROM receipts"
@@ -1,3 +1,7 @@
+import sqlite3
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import patch
 from uuid import uuid1
 
 import pandas as pd
@@ -14,15 +18,48 @@ class TestFileStore:
     def test_init_parquet(self, tmp_path):
         s = store.FileStore(cache_store=tmp_path, backend="parquet")
         assert isinstance(s.serializer, serializer.ParquetSerializer)
-        s.serializer.compression == "snappy"
+        assert s.serializer.compression == "zstd"
         assert s.cache_store.exists()
 
+    def test_init_row_group_size(self, tmp_path, query, results, metadata):
+        import pyarrow.parquet as pq
+
+        s = store.FileStore(cache_store=tmp_path, row_group_size=1)
+        assert s.serializer.row_group_size == 1
+        s.dump(query, results, metadata)
+        parquet_file = pq.ParquetFile(s.get_cache_filepath(query))
+        assert parquet_file.metadata.row_group(0).num_rows == 1
+        assert parquet_file.num_row_groups == len(results)
+
+        with pytest.raises(ValueError) as excinfo:
+            store.FileStore(cache_store=tmp_path, backend="joblib", row_group_size=1)
+        assert "only supported by the parquet backend" in str(excinfo.value)
+
     def test_init_joblib(self, tmp_path):
         s = store.FileStore(cache_store=tmp_path, backend="joblib")
         assert isinstance(s.serializer, serializer.JoblibSerializer)
         s.serializer.compression == 0
         assert s.cache_store.exists()
 
+    def test_init_feather(self, tmp_path):
+        s = store.FileStore(cache_store=tmp_path, backend="feather")
+        assert isinstance(s.serializer, serializer.FeatherSerializer)
+        assert s.cache_store == tmp_path / "feather"
+        assert s.cache_store.exists()
+
+    def test_init_pickle(self, tmp_path):
+        s = store.FileStore(cache_store=tmp_path, backend="pickle")
+        assert s.cache_store == tmp_path / "pickle"
+        assert isinstance(s.serializer, serializer.PickleSerializer)
+
+    def test_dump_load_feather(self, tmp_path, query, results, metadata):
+        s = store.FileStore(cache_store=tmp_path, backend="feather")
+        s.dump(query, results, metadata)
+        assert s.get_cache_filepath(query).suffix == ".feather"
+        results_loaded, metadata_loaded = s.load(query)
+        assert results.equals(results_loaded)
+        assert metadata == metadata_loaded
+
     def test_get_filepaths_parquet(self, tmp_path, query):
         """Test the metadata and results cache file"""
         s = store.FileStore(cache_store=tmp_path)
@@ -64,6 +101,22 @@ class TestFileStore:
             file_store.load_metadata("select * from dummy")
         assert "Metadata for the given query does not exist." in str(excinfo.value)
 
+    def test_dump_metadata_concurrently(self, file_store, query, metadata):
+        def dump_metadata(i):
+            file_store.dump_metadata(query, dict(metadata, duration=i))
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            list(executor.map(dump_metadata, range(32)))
+
+        assert file_store.load_metadata(query)["duration"] in range(32)
+        assert list(file_store.cache_store.glob("*.tmp")) == []
+
+    def test_dump_load_metadata_without_orjson(self, file_store, query, metadata):
+        with patch.object(store, "orjson", None):
+            file_store.dump_metadata(query, metadata)
+            assert metadata == file_store.load_metadata(query)
+        assert metadata == file_store.load_metadata(query)
+
     def test_dump_load_results(self, file_store, query, results):
         file_store.dump_results(query, results)
         assert file_store.get_cache_filepath(query).exists()
@@ -74,6 +127,40 @@ class TestFileStore:
             file_store.load_results("select * from dummy")
         assert "Cached results for the given query do not exist." in str(excinfo.value)
 
+    def test_load_results_columns(self, file_store, query, results, metadata):
+        file_store.dump(query, results, metadata)
+        assert results[["b"]].equals(file_store.load_results(query, columns=["b"]))
+        results_loaded, _ = file_store.try_load(query, columns=["b"])
+        assert results[["b"]].equals(results_loaded)
+
+        with pytest.raises(KeyError):
+            file_store.load_results(query, columns=["zz"])
+
+    def test_load_results_arrow(self, file_store, query, results, metadata):
+        file_store.dump(query, results, metadata)
+        assert results.equals(file_store.load_results_arrow(query).to_pandas())
+
+        with pytest.raises(ValueError) as excinfo:
+            file_store.load_results_arrow("select * from dummy")
+        assert "Cached results for the given query do not exist." in str(excinfo.value)
+
+    def test_dump_results_is_atomic(self, file_store, query, results):
+        file_store.dump_results(query, results)
+
+        def failing_dump(results, filepath):
+            with open(filepath, "wb") as f:
+                f.write(b"partial")
+            raise RuntimeError("Disk full")
+
+        with patch.object(file_store.serializer, "dump", failing_dump):
+            with pytest.raises(RuntimeError):
+                file_store.dump_results(query, results.head(1))
+
+        assert results.equals(file_store.load_results(query))
+        assert list(file_store.cache_store.iterdir()) == [
+            file_store.get_cache_filepath(query)
+        ]
+
     def test_dump_load(self, file_store, query, results, metadata):
         file_store.dump(query, results, metadata)
         assert file_store.get_cache_filepath(query).exists()
@@ -86,6 +173,47 @@ class TestFileStore:
             file_store.load("select * from dummy")
         assert "Cached results for the given query do not exist." in str(excinfo.value)
 
+    def test_try_load(self, file_store, query, results, metadata):
+        assert file_store.try_load(query) is None
+
+        file_store.dump(query, results, metadata)
+        results_loaded, metadata_loaded = file_store.try_load(query)
+        assert results.equals(results_loaded)
+        assert metadata == metadata_loaded
+
+        file_store.get_cache_filepath(query).unlink()
+        assert file_store.try_load(query) is None
+
+    def test_background_dump(self, tmp_path, query, results, metadata):
+        s = store.FileStore(cache_store=tmp_path, background_dump=True)
+        written = threading.Event()
+        dump_results = s.dump_results
+
+        def slow_dump_results(*args):
+            written.wait(timeout=5)
+            dump_results(*args)
+
+        with patch.object(s, "dump_results", side_effect=slow_dump_results):
+            s.dump(query, results, metadata)
+            assert metadata["query"] == query
+            assert metadata["cache_file"] == s.get_cache_filepath(query).name
+            results.loc[0, "a"] = 10  # Does not alter what is being written
+            assert not s.get_cache_filepath(query).exists()
+            written.set()
+            assert s.exists(query), "Reads should wait for the pending dump"
+
+        results_loaded = s.load_results(query)
+        assert results_loaded.loc[0, "a"] == 0
+        assert s._pending_dumps == {}
+
+    def test_background_dump_failure_is_logged(self, tmp_path, query, caplog):
+        s = store.FileStore(cache_store=tmp_path, background_dump=True)
+        results = pd.Series([uuid1() for i in range(3)], name="uuid_col").to_frame()
+        s.dump(query, results, {})
+        s.flush()
+        assert not s.exists(query)
+        assert "Background dump to cache failed" in caplog.text
+
     def test_exists_in_cache(self, file_store, query, metadata, results):
         """Test the function that asserts if there is cache for a given string"""
         assert not file_store.get_metadata_filepath(query).exists()
@@ -139,6 +267,45 @@ class TestFileStore:
 
         assert store1.list().equals(store2.list())
 
+    def test_import_cache_extracts_metadata_last(
+        self, tmp_path, query, metadata, results
+    ):
+        store1 = store.FileStore(cache_store=tmp_path / "cache1")
+        store2 = store.FileStore(cache_store=tmp_path / "cache2")
+        for i in range(4):
+            store1.dump(f"{query} -- {i}", results, metadata)
+        store1.export(tmp_path / "cache.zip")
+
+        extracted = []
+        extract_atomic_original = store._extract_atomic
+
+        def extract_atomic(myzip, member, directory):
+            extracted.append(member.filename)
+            extract_atomic_original(myzip, member, directory)
+
+        with patch.object(store, "_extract_atomic", extract_atomic):
+            store2.import_cache(tmp_path / "cache.zip")
+
+        is_metadata = [filename.endswith(".json") for filename in extracted]
+        assert is_metadata == sorted(is_metadata), "Metadata extracted before results"
+        assert len(extracted) == 8
+        assert not list(store2.cache_store.glob("*.tmp"))
+        assert store1.list().equals(store2.list())
+
+    def test_export_import_cache_streaming_big_files(
+        self, tmp_path, query, metadata, results
+    ):
+        store1 = store.FileStore(cache_store=tmp_path / "cache1")
+        store2 = store.FileStore(cache_store=tmp_path / "cache2")
+        store1.dump(query, results, metadata)
+
+        with patch.object(store, "_PREFETCH_MAX_SIZE", 0):
+            store1.export(tmp_path / "cache.zip")
+        store2.import_cache(tmp_path / "cache.zip")
+
+        assert store1.list().equals(store2.list())
+        assert results.equals(store2.load_results(query))
+
     def test_export_import_cache_with_queries_list(
         self, tmp_path, query, metadata, results
     ):
@@ -194,8 +361,78 @@ class TestFileStore:
         assert "Database(uri='...', store_backend='joblib')" in str(excinfo.value)
 
 
+class TestSQLiteStore:
+    def test_init(self, tmp_path):
+        with store.SQLiteStore(cache_store=tmp_path) as s:
+            assert s.database == tmp_path / "parquet" / "cache.sqlite"
+            assert s.database.exists()
+
+        with pytest.raises(sqlite3.ProgrammingError):
+            s.exists("select 1")
+
+        with store.SQLiteStore(cache_store=tmp_path, row_group_size=1) as s:
+            assert s.serializer.row_group_size == 1
+
+    @pytest.mark.parametrize("backend", ["parquet", "joblib", "feather", "pickle"])
+    def test_dump_load(self, tmp_path, query, results, metadata, backend):
+        with store.SQLiteStore(
+            cache_store=tmp_path, backend=backend, normalize=True
+        ) as s:
+            assert not s.exists(query)
+            assert s.try_load(query) is None
+
+            s.dump(query, results, metadata)
+            assert s.exists(query)
+            assert s.exists(query.replace(" ", "\n"))
+            results_loaded, metadata_loaded = s.load(query)
+            assert results.equals(results_loaded)
+            assert metadata == metadata_loaded
+            assert results.equals(s.load_results(query))
+            assert results[["b"]].equals(s.load_results(query, columns=["b"]))
+            with pytest.raises(KeyError):
+                s.load_results(query, columns=["zz"])
+            assert metadata == s.load_metadata(query)
+
+            with pytest.raises(ValueError) as excinfo:
+                s.load("select * from dummy")
+            assert "Cached results for the given query do not exist." in str(
+                excinfo.value
+            )
+
+    def test_list(self, tmp_path, query, results, metadata):
+        with store.SQLiteStore(cache_store=tmp_path, normalize=True) as s:
+            assert s.list().shape == (0, 4)
+
+            s.dump(query, results, metadata)
+            store_content = s.list()
+            assert store_content.shape[0] == 1
+            assert store_content.loc[0, "query"] == utils.normalize_query(query)
+
+    def test_export_import_cache_with_file_store(
+        self, tmp_path, query, metadata, results
+    ):
+        file_store = store.FileStore(cache_store=tmp_path / "cache1")
+        with store.SQLiteStore(cache_store=tmp_path / "cache2") as sqlite_store:
+            file_store.dump(query, results, metadata)
+
+            file_store.export(tmp_path / "cache1.zip")
+            sqlite_store.import_cache(tmp_path / "cache1.zip")
+            assert file_store.list().equals(sqlite_store.list())
+            assert results.equals(sqlite_store.load_results(query))
+
+            sqlite_store.export(tmp_path / "cache2.zip")
+            file_store.import_cache(tmp_path / "cache2.zip")
+            assert file_store.list().equals(sqlite_store.list())
+
+
 class TestHashQuery:
     def test_hash_query(self, query):
         assert store.hash_query(query) == "26689adeaee8e1b156ad49334ee522dd89bd9142"
 
         assert store.hash_query(query) != store.hash_query(query, normalize=True)
+
+    def test_hash_query_is_memoized(self, query):
+        store.hash_query.cache_clear()
+        store.hash_query(query, normalize=True)
+        store.hash_query(query, normalize=True)
+        assert store.hash_query.cache_info().hits == 1
@@ -93,3 +93,21 @@ class TestCache:
         ids = tuple(range(40000))
         query = f"select * from table where id in ({ids})"
         assert utils.normalize_query(query) == query
+
+    def test_normalize_query_matches_sqlparse_format(self):
+        import sqlparse
+
+        queries = [
+            "select a, b from t where x = 1 -- comment\n and y in (1, 2)",
+            "select 1; select 2",
+            "with x as (select 1) select * from x /* comment */ order by 1",
+        ]
+        for query in queries * 2:
+            assert utils._format(query) == sqlparse.format(
+                query,
+                reindent=True,
+                indent_tabs=False,
+                indent_width=4,
+                keyword_case="upper",
+                strip_comments=True,
+            )